@@ -0,0 +1,231 @@
+import matplotlib
+matplotlib.use('Agg')  # İşçi süreçlerde grafik penceresi açılmasın
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from hr_anomaly_detection import load_heart_rate_records, detect_hr_episodes
+from ecg_advanced_analysis import analyze_yearly_data
+from blood_test_analysis import extract_blood_data
+from workout_analysis import analyze_gpx_with_pace
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Her kişinin dışa aktarım klasöründeki sabit yollar
+XML_FILE = 'dışa aktarılan.xml'
+ECG_DIR = 'electrocardiograms'
+BLOOD_DIR = 'enabızveri'
+WORKOUT_DIR = 'workout-routes'
+
+def find_subjects(input_dir):
+    """List per-subject export bundles in a directory"""
+    subjects = []
+    for name in sorted(os.listdir(input_dir)):
+        path = os.path.join(input_dir, name)
+        # __MACOSX, gizli klasörler ve önceki çıktı klasörleri kişi değildir
+        if name.startswith(('.', '__')) or not os.path.isdir(path):
+            continue
+        if any(os.path.exists(os.path.join(path, item))
+               for item in (XML_FILE, ECG_DIR, BLOOD_DIR, WORKOUT_DIR)):
+            subjects.append(path)
+    return subjects
+
+def file_status(found, parsed):
+    """'ok' if every file was parsed, 'partial' if some, 'error' if none"""
+    if parsed >= found:
+        return 'ok'
+    return 'partial' if parsed > 0 else 'error'
+
+def run_heart_rate(subject_dir, out_dir):
+    """Heart rate anomaly episodes from the Apple Health XML"""
+    df = load_heart_rate_records(os.path.join(subject_dir, XML_FILE))
+    episodes = detect_hr_episodes(df)
+    episodes.to_csv(os.path.join(out_dir, 'heart_rate_episodes.csv'), index=False)
+    return {'hr_samples': len(df), 'hr_episodes': len(episodes)}
+
+def run_ecg(subject_dir, out_dir):
+    """Abnormal beat and HRV spectral summary per year"""
+    ecg_dir = os.path.join(subject_dir, ECG_DIR)
+    years = sorted({f[4:8] for f in os.listdir(ecg_dir) if f.startswith('ecg_')})
+
+    rows = []
+    for year in years:
+        # Yıl yıl işle, ham sinyal bir sonraki yıla taşınmasın
+        results = analyze_yearly_data(year, ecg_dir)
+        rows.append({'year': year,
+                     'total_beats': len(results['peaks']),
+                     'abnormal_beats': len(results['abnormal_idx']),
+                     **results['spectral_metrics']})
+        del results
+
+    pd.DataFrame(rows).to_csv(os.path.join(out_dir, 'ecg_summary.csv'), index=False)
+    return {'ecg_years': len(rows)}
+
+def run_blood(subject_dir, out_dir):
+    """Blood test results extracted from e-Nabız PDFs"""
+    blood_dir = os.path.join(subject_dir, BLOOD_DIR)
+    pdf_files = [f for f in os.listdir(blood_dir)
+                 if f.startswith('Enabiz-Tahlilleri-') and f.endswith('.pdf')]
+
+    # extract_blood_data hataları yutar; okunamayan PDF'leri listeden al
+    failed_files = []
+    blood_df = extract_blood_data(blood_dir, failed_files)
+    blood_df.to_csv(os.path.join(out_dir, 'blood_tests.csv'), index=False)
+    return {'blood_tests': len(blood_df),
+            'pdf_failed': len(failed_files),
+            'status': file_status(len(pdf_files), len(pdf_files) - len(failed_files))}
+
+def run_workouts(subject_dir, out_dir):
+    """Pace statistics for every GPX route"""
+    workout_dir = os.path.join(subject_dir, WORKOUT_DIR)
+    gpx_files = sorted(f for f in os.listdir(workout_dir) if f.endswith('.gpx'))
+
+    rows = []
+    for file in gpx_files:
+        stats = analyze_gpx_with_pace(os.path.join(workout_dir, file), plot=False)
+        if stats:
+            rows.append(stats)
+
+    # analyze_gpx_with_pace hatada None döndürür
+    pd.DataFrame(rows).to_csv(os.path.join(out_dir, 'workouts.csv'), index=False)
+    return {'workouts': len(rows),
+            'gpx_failed': len(gpx_files) - len(rows),
+            'status': file_status(len(gpx_files), len(rows))}
+
+PIPELINES = [
+    ('xml', XML_FILE, run_heart_rate),
+    ('ecg', ECG_DIR, run_ecg),
+    ('pdf', BLOOD_DIR, run_blood),
+    ('gpx', WORKOUT_DIR, run_workouts),
+]
+
+def failed_summary(subject, error):
+    """Summary row for a subject that could not be processed at all"""
+    summary = {'subject': subject, 'seconds': 0.0, 'error': error}
+    summary.update({name: 'error' for name, _, _ in PIPELINES})
+    return summary
+
+def process_subject(args):
+    """Run one subject; unexpected errors become an 'error' row instead of stopping the run"""
+    subject_dir, output_dir = args
+    try:
+        return run_subject(subject_dir, output_dir)
+    except Exception as e:
+        return failed_summary(os.path.basename(subject_dir), str(e))
+
+def run_subject(subject_dir, output_dir):
+    """Run every pipeline for one subject, writing into its own output folder"""
+    subject = os.path.basename(subject_dir)
+    out_dir = os.path.join(output_dir, subject)
+    os.makedirs(out_dir, exist_ok=True)
+
+    summary = {'subject': subject}
+    start = time.time()
+
+    # Analiz çıktıları kişinin log dosyasına gitsin
+    with open(os.path.join(out_dir, 'log.txt'), 'w', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log):
+        for name, path, pipeline in PIPELINES:
+            if not os.path.exists(os.path.join(subject_dir, path)):
+                summary[name] = 'missing'
+                continue
+            try:
+                stats = pipeline(subject_dir, out_dir)
+                summary[name] = stats.pop('status', 'ok')
+                summary.update(stats)
+            except Exception as e:
+                print(f"{name} hatası: {str(e)}")
+                summary[name] = 'error'
+
+    summary['seconds'] = round(time.time() - start, 2)
+    if resource is not None:
+        # ru_maxrss Linux'ta KB, macOS'ta byte cinsinden
+        rss_unit = 1024 ** 2 if sys.platform == 'darwin' else 1024
+        summary['peak_rss_mb'] = round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / rss_unit, 1)
+    return summary
+
+def run_pool(subjects, output_dir, workers, on_done):
+    """Process subjects in a pool; return those lost to a crashed worker"""
+    broken = []
+    # max_tasks_per_child=1: her kişi yeni bir süreçte işlenir, bellek birikmez
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        futures = {executor.submit(process_subject, (subject_dir, output_dir)): subject_dir
+                   for subject_dir in subjects}
+        for future in as_completed(futures):
+            try:
+                on_done(future.result())
+            except BrokenProcessPool:
+                broken.append(futures[future])
+    return broken
+
+def run_batch(input_dir, output_dir='batch_output', workers=None):
+    """Shard subjects across a process pool and write a run summary"""
+    run_start = time.perf_counter()
+    subjects = find_subjects(input_dir)
+    if not subjects:
+        print(f"No subject folders found in '{input_dir}'")
+        return pd.DataFrame()
+
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Found {len(subjects)} subjects")
+
+    summaries = []
+
+    def report_progress(summary):
+        summaries.append(summary)
+        statuses = ', '.join(f"{name}={summary[name]}" for name, _, _ in PIPELINES)
+        print(f"[{len(summaries)}/{len(subjects)}] {summary['subject']}: {statuses} "
+              f"({summary['seconds']:.1f} s)")
+
+    # İlk tur paralel; bir işçi ölürse (ör. OOM) havuz bozulur ve bekleyen
+    # tüm kişiler etkilenir. Etkilenenler ikinci turda tek tek denenir.
+    retry = run_pool(subjects, output_dir, workers, report_progress)
+    for subject_dir in retry:
+        if run_pool([subject_dir], output_dir, 1, report_progress):
+            report_progress(failed_summary(os.path.basename(subject_dir),
+                                           'worker process died'))
+
+    report = pd.DataFrame(summaries).sort_values('subject')
+    report.to_csv(os.path.join(output_dir, 'batch_summary.csv'), index=False)
+
+    print("\nBatch Summary:")
+    print("-" * 40)
+    for name, _, _ in PIPELINES:
+        counts = report[name].value_counts()
+        print(f"{name:.<10} ok: {counts.get('ok', 0)}, partial: {counts.get('partial', 0)}, "
+              f"error: {counts.get('error', 0)}, missing: {counts.get('missing', 0)}")
+
+    # Duvar saati süresi: her kişi için yeni süreç başlatma/import maliyeti dahil
+    wall_seconds = round(time.perf_counter() - run_start, 2)
+    worker_seconds = round(report['seconds'].sum(), 2)
+    with open(os.path.join(output_dir, 'batch_run.json'), 'w', encoding='utf-8') as f:
+        json.dump({'subjects': len(report), 'workers': workers,
+                   'wall_seconds': wall_seconds, 'worker_seconds': worker_seconds},
+                  f, indent=2)
+    print(f"Total time: {wall_seconds:.1f} s (worker time: {worker_seconds:.1f} s)")
+
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all analyses for many subjects')
+    parser.add_argument('input_dir', help='Directory with one export folder per subject')
+    parser.add_argument('--output', default='batch_output', help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Number of processes')
+    args = parser.parse_args()
+
+    run_batch(args.input_dir, args.output, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import matplotlib
+matplotlib.use('Agg')  # Benchmark sırasında grafik penceresi açılmasın
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import synthetic_data
+from hr_anomaly_detection import load_heart_rate_records
+from ecg_advanced_analysis import load_all_ecg_data, detect_abnormal_beats, spectral_analysis
+from daily_period_analysis import analyze_24h_periods
+from workout_analysis import analyze_gpx_with_pace
+from blood_test_analysis import parse_test_line
+
+RESULTS_DIR = 'benchmark_results'
+
+# Her benchmark için ölçekler (N: kayıt, EKG dosyası, GPX noktası, metin satırı)
+SCALES = {
+    'quick': {
+        'load_heart_rate_records': [10_000],
+        'detect_abnormal_beats': [2],
+        'spectral_analysis': [2],
+        'analyze_24h_periods': [5_000],
+        'analyze_gpx_with_pace': [1_000],
+        'parse_test_line': [10_000],
+    },
+    'full': {
+        'load_heart_rate_records': [10_000, 100_000, 1_000_000],
+        'detect_abnormal_beats': [2, 20, 100],
+        'spectral_analysis': [2, 20, 100],
+        'analyze_24h_periods': [5_000, 50_000, 500_000],
+        'analyze_gpx_with_pace': [1_000, 10_000, 50_000],
+        'parse_test_line': [10_000, 100_000, 500_000],
+    },
+}
+
+def setup_load_heart_rate_records(n, workdir):
+    path = os.path.join(workdir, f'export_{n}.xml')
+    synthetic_data.write_health_export(path, n)
+    return lambda: load_heart_rate_records(path)
+
+def setup_detect_abnormal_beats(n, workdir):
+    folder = os.path.join(workdir, f'ecg_{n}')
+    synthetic_data.write_ecg_files(folder, n)
+    ecg_data = load_all_ecg_data('2021', folder)
+    return lambda: detect_abnormal_beats(ecg_data)
+
+def setup_spectral_analysis(n, workdir):
+    folder = os.path.join(workdir, f'ecg_{n}')
+    if not os.path.exists(folder):
+        synthetic_data.write_ecg_files(folder, n)
+    _, _, rr_intervals = detect_abnormal_beats(load_all_ecg_data('2021', folder))
+    return lambda: spectral_analysis(rr_intervals)
+
+def setup_analyze_24h_periods(n, workdir):
+    df = synthetic_data.make_heart_rate_frame(n)
+
+    def run():
+        # Fonksiyon 'period' sütunu ekliyor, her tekrarda temiz kopya kullan
+        analyze_24h_periods(df.copy())
+        plt.close('all')
+    return run
+
+def setup_analyze_gpx_with_pace(n, workdir):
+    path = os.path.join(workdir, f'route_{n}.gpx')
+    synthetic_data.write_gpx_route(path, n)
+    return lambda: analyze_gpx_with_pace(path, plot=False)
+
+def setup_parse_test_line(n, workdir):
+    lines = synthetic_data.make_enabiz_lines(n)
+    return lambda: [parse_test_line(line) for line in lines]
+
+BENCHMARKS = {
+    'load_heart_rate_records': setup_load_heart_rate_records,
+    'detect_abnormal_beats': setup_detect_abnormal_beats,
+    'spectral_analysis': setup_spectral_analysis,
+    'analyze_24h_periods': setup_analyze_24h_periods,
+    'analyze_gpx_with_pace': setup_analyze_gpx_with_pace,
+    'parse_test_line': setup_parse_test_line,
+}
+
+def measure(func, repeat=3):
+    """Best/mean wall time over `repeat` runs and peak traced memory of one run"""
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+        # Bellek ölçümü ayrı çalıştırılır, tracemalloc zamanlamayı yavaşlatır
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {'best_s': min(times), 'mean_s': float(np.mean(times)),
+            'peak_mb': peak / 1024 ** 2}
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def run_benchmarks(scale='quick', names=None, repeat=3):
+    """Run the selected benchmarks at every configured size"""
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, setup in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            for n in SCALES[scale][name]:
+                func = setup(n, workdir)
+                stats = measure(func, repeat)
+                results.append({'benchmark': name, 'n': n, **stats})
+                print(f"{name:.<28} n={n:<10} best {stats['best_s']:>9.4f} s  "
+                      f"peak {stats['peak_mb']:>8.1f} MB")
+    return results
+
+def save_results(results, scale, output_dir=RESULTS_DIR):
+    """Store results with run metadata so runs can be compared later"""
+    os.makedirs(output_dir, exist_ok=True)
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': scale,
+        'results': results,
+    }
+    path = os.path.join(output_dir, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    return path
+
+def compare_results(baseline_path, current_path):
+    """Print time/memory ratios between two saved runs"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(current_path, encoding='utf-8') as f:
+        current = json.load(f)
+
+    old = {(r['benchmark'], r['n']): r for r in baseline['results']}
+    print(f"Baseline: {baseline['commit']} ({baseline['timestamp']})")
+    print(f"Current:  {current['commit']} ({current['timestamp']})")
+    print("-" * 70)
+    for r in current['results']:
+        key = (r['benchmark'], r['n'])
+        if key not in old:
+            continue
+        time_ratio = r['best_s'] / old[key]['best_s'] if old[key]['best_s'] > 0 else 0
+        mem_ratio = r['peak_mb'] / old[key]['peak_mb'] if old[key]['peak_mb'] > 0 else 0
+        print(f"{r['benchmark']:.<28} n={r['n']:<10} "
+              f"time x{time_ratio:>6.2f}  memory x{mem_ratio:>6.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the analysis pipelines')
+    parser.add_argument('--scale', choices=list(SCALES), default='quick')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS),
+                        help='Run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='Compare two saved result files instead of running')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_results(*args.compare)
+        return
+
+    results = run_benchmarks(args.scale, args.only, args.repeat)
+    path = save_results(results, args.scale)
+    print(f"\nResults saved to {path}")
+
+if __name__ == "__main__":
+    main()
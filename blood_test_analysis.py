@@ -32,9 +32,13 @@ def parse_test_line(line):
             }
     return None
 
-def extract_blood_data(folder_path='enabızveri'):
+def extract_blood_data(folder_path='enabızveri', failed_files=None):
     """Extract blood test data from multiple PDF files"""
     all_blood_tests = []
+    pdf_files = []
+    # Okunamayan PDF'lerin adları failed_files listesine eklenir
+    if failed_files is None:
+        failed_files = []
     
     try:
         pdf_files = sorted([f for f in os.listdir(folder_path) 
@@ -67,6 +71,7 @@ def extract_blood_data(folder_path='enabızveri'):
                 
             except Exception as e:
                 print(f"PDF okuma hatası ({pdf_file}): {str(e)}")
+                failed_files.append(pdf_file)
                 continue
         
         # DataFrame oluştur
@@ -81,6 +86,8 @@ def extract_blood_data(folder_path='enabızveri'):
         
     except Exception as e:
         print(f"Klasör okuma hatası: {str(e)}")
+        # Sonuç atıldığı için tüm dosyalar başarısız sayılır
+        failed_files.extend(f for f in pdf_files if f not in failed_files)
         return pd.DataFrame()
 
 def analyze_blood_tests(df):
@@ -2,6 +2,7 @@
 import xml.etree.ElementTree as ET
 import pandas as pd
 import matplotlib.pyplot as plt
+from hr_anomaly_detection import detect_hr_episodes
 
 # 2. XML dosyasını yükle
 file_path = 'dışa aktarılan.xml'  # XML dosyanın tam adı burada
@@ -19,18 +20,25 @@ for record in root.findall('Record'):
         })
 
 # 4. Veriyi pandas DataFrame'e dönüştür
-df = pd.DataFrame(heart_rate_data)
+df = pd.DataFrame(heart_rate_data, columns=['timestamp', 'heart_rate'], dtype=object)
 
 # 5. Veriyi temizle ve dönüştür
 df['heart_rate'] = pd.to_numeric(df['heart_rate'], errors='coerce')  # Sayısal forma çevir
-df['timestamp'] = pd.to_datetime(df['timestamp'])  # Tarih formatına çevir
+df['timestamp'] = pd.to_datetime(df['timestamp'].astype(str).str[:19], errors='coerce')  # Tarih formatına çevir (yerel saat, ofset karışıklığı olmasın)
 df = df.dropna()  # Eksik değerleri kaldır
+raw_df = df  # Anomali tespiti için kırpılmamış veri
 df = df[(df['heart_rate'] > 40) & (df['heart_rate'] < 180)]  # Mantıklı değerleri filtrele
 
 # 6. Veriyi kontrol et
 print("İlk 5 satır:\n", df.head())
 print("\nVeri Özeti:\n", df.describe())
 
+# 6b. Bağlama duyarlı anomali tespiti (saat + hafta içi/sonu referansı)
+episodes = detect_hr_episodes(raw_df)  # 40-180 filtresi sadece özet ve grafikler için
+print(f"\nAnormal bölüm sayısı: {len(episodes)}")
+if not episodes.empty:
+    print(episodes.to_string(index=False))
+
 # 7. Basit bir zaman serisi grafiği oluştur
 plt.plot(df['timestamp'], df['heart_rate'])
 plt.title("Heart Rate Over Time")
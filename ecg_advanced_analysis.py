@@ -6,10 +6,9 @@ import matplotlib.pyplot as plt
 import os
 from datetime import datetime
 
-def load_all_ecg_data(year):
+def load_all_ecg_data(year, base_path='electrocardiograms'):
     """Load all ECG files for a specific year"""
     data = []
-    base_path = 'electrocardiograms'
     
     # Get all files for the specified year
     files = [f for f in os.listdir(base_path) if f.startswith(f'ecg_{year}')]
@@ -88,12 +87,12 @@ def spectral_analysis(rr_intervals, sampling_rate=512.469):
     
     return metrics, xf, power
 
-def analyze_yearly_data(year):
+def analyze_yearly_data(year, base_path='electrocardiograms'):
     """Analyze ECG data for a specific year"""
     print(f"\nAnalyzing ECG data for {year}...")
     
     # Load data
-    ecg_data = load_all_ecg_data(year)
+    ecg_data = load_all_ecg_data(year, base_path)
     
     # Detect abnormal beats
     peaks, abnormal_idx, rr_intervals = detect_abnormal_beats(ecg_data)
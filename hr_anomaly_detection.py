@@ -0,0 +1,135 @@
+import xml.etree.ElementTree as ET
+import pandas as pd
+import numpy as np
+
+# MAD -> standart sapma ölçek katsayısı (normal dağılım için)
+MAD_SCALE = 1.4826
+
+# Sadece sensör hatalarını ele; 40-180 dışı gerçek taşikardi/bradikardi tespit edilmeli
+ARTIFACT_MIN = 25
+ARTIFACT_MAX = 250
+
+def load_heart_rate_records(file_path='dışa aktarılan.xml'):
+    """Stream heart rate records from an Apple Health export"""
+    timestamps = []
+    values = []
+
+    # iterparse ile oku; her üst düzey eleman (Record, Workout, ActivitySummary...)
+    # bittiğinde kökü temizle ki ağaç bellekte birikmesin
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if elem.tag == 'Record' and \
+                elem.attrib.get('type') == 'HKQuantityTypeIdentifierHeartRate':
+            timestamps.append(elem.attrib.get('startDate'))
+            values.append(elem.attrib.get('value'))
+        if depth == 1:
+            root.clear()
+
+    # dtype=object: kalp atışı kaydı yoksa (ör. sadece iPhone) sütun float olmasın
+    df = pd.DataFrame({'timestamp': timestamps, 'heart_rate': values}, dtype=object)
+    df['heart_rate'] = pd.to_numeric(df['heart_rate'], errors='coerce')
+    # Yaz/kış saati geçişlerinde ofsetler karışır (+0200/+0300); saat bağlamı
+    # yerel duvar saatine göre olduğundan sadece yerel kısmı ('%Y-%m-%d %H:%M:%S') kullan
+    df['timestamp'] = pd.to_datetime(df['timestamp'].astype(str).str[:19],
+                                     format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    return df.dropna()
+
+def compute_context_baselines(df, window='28D', min_periods=20, min_mad=1.0):
+    """Rolling median/MAD baselines per hour-of-day and day type"""
+    df = df.sort_values('timestamp').reset_index(drop=True)
+    series = pd.Series(df['heart_rate'].to_numpy(dtype=float),
+                       index=pd.DatetimeIndex(df['timestamp']))
+
+    # Bağlam: günün saati + hafta içi/hafta sonu
+    hour = df['timestamp'].dt.hour.to_numpy()
+    is_weekend = (df['timestamp'].dt.dayofweek >= 5).to_numpy()
+    context = pd.Series(hour * 2 + is_weekend, index=series.index)
+
+    def rolling_median(values):
+        # closed='left': mevcut ölçüm kendi referansına dahil edilmez
+        return values.rolling(window, min_periods=min_periods,
+                              closed='left').median()
+
+    median = series.groupby(context.to_numpy()).transform(rolling_median)
+    deviation = (series - median).abs()
+    mad = deviation.groupby(context.to_numpy()).transform(rolling_median)
+
+    # Çok düzgün bağlamlarda sıfıra bölmeyi önle
+    scale = np.maximum(mad.to_numpy(), min_mad) * MAD_SCALE
+
+    df['hour'] = hour
+    df['day_type'] = np.where(is_weekend, 'weekend', 'weekday')
+    df['baseline'] = median.to_numpy()
+    df['mad'] = mad.to_numpy()
+    df['score'] = (series.to_numpy() - median.to_numpy()) / scale
+    return df
+
+def detect_hr_episodes(df, threshold=3.5, max_gap='10min', min_duration='5min',
+                       min_samples=3, **baseline_kwargs):
+    """Flag sustained deviations from the context baseline as episodes"""
+    columns = ['start', 'end', 'duration', 'direction', 'n_samples',
+               'peak_time', 'peak_hr', 'peak_score', 'baseline']
+    df = df[(df['heart_rate'] > ARTIFACT_MIN) & (df['heart_rate'] < ARTIFACT_MAX)]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    scored = compute_context_baselines(df, **baseline_kwargs)
+    score = scored['score'].to_numpy()
+
+    # Yön: +1 yüksek, -1 düşük, 0 normal (baseline yoksa NaN -> 0)
+    direction = np.zeros(len(scored), dtype=np.int8)
+    direction[score > threshold] = 1
+    direction[score < -threshold] = -1
+
+    # Yön değiştiğinde veya ölçümler arasında büyük boşluk olduğunda yeni bölüm başlar
+    gap = scored['timestamp'].diff() > pd.Timedelta(max_gap)
+    new_run = np.r_[True, direction[1:] != direction[:-1]] | gap.to_numpy()
+    scored['run'] = np.cumsum(new_run)
+    scored['direction'] = direction
+    scored['abs_score'] = np.abs(score)
+
+    flagged = scored[direction != 0]
+    if flagged.empty:
+        return pd.DataFrame(columns=columns)
+
+    grouped = flagged.groupby('run')
+    episodes = grouped.agg(start=('timestamp', 'min'),
+                           end=('timestamp', 'max'),
+                           direction=('direction', 'first'),
+                           n_samples=('heart_rate', 'size'))
+    peaks = flagged.loc[grouped['abs_score'].idxmax()].set_index('run')
+    episodes['peak_time'] = peaks['timestamp']
+    episodes['peak_hr'] = peaks['heart_rate']
+    episodes['peak_score'] = peaks['score']
+    episodes['baseline'] = peaks['baseline']
+    episodes['duration'] = episodes['end'] - episodes['start']
+
+    # Sadece sürekli sapmaları tut
+    sustained = ((episodes['duration'] >= pd.Timedelta(min_duration)) &
+                 (episodes['n_samples'] >= min_samples))
+    episodes = episodes[sustained].copy()
+    episodes['direction'] = np.where(episodes['direction'] > 0, 'high', 'low')
+
+    return episodes[columns].reset_index(drop=True)
+
+def main():
+    df = load_heart_rate_records()
+
+    episodes = detect_hr_episodes(df)
+
+    print(f"Toplam ölçüm: {len(df)}")
+    print(f"Anormal bölüm sayısı: {len(episodes)}")
+    if not episodes.empty:
+        print("\nAnormal Bölümler:")
+        print(episodes.to_string(index=False))
+
+if __name__ == "__main__":
+    main()
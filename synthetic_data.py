@@ -0,0 +1,155 @@
+import os
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+
+# Apple Watch EKG örnekleme frekansı
+ECG_SAMPLING_RATE = 512.469
+
+RECORD_TYPES = [
+    ('HKQuantityTypeIdentifierHeartRate', 'count/min'),
+    ('HKQuantityTypeIdentifierStepCount', 'count'),
+    ('HKQuantityTypeIdentifierActiveEnergyBurned', 'kcal'),
+    ('HKQuantityTypeIdentifierDistanceWalkingRunning', 'km'),
+]
+
+BLOOD_TESTS = [
+    ('Hemoglobin', 'g/dL', 14.5), ('Demir', 'ug/dL', 150.0),
+    ('Ferritin', 'ng/mL', 100.0), ('Vitamin B12', 'pg/mL', 300.0),
+    ('ALT', 'U/L', 25.0), ('AST', 'U/L', 28.0), ('CK', 'U/L', 150.0),
+    ('HDL', 'mg/dL', 50.0), ('LDL', 'mg/dL', 110.0),
+]
+
+def heart_rate_values(timestamps, rng):
+    """Heart rate with a daily rhythm and noise"""
+    hours = timestamps.hour + timestamps.minute / 60
+    daily = 12 * np.sin((hours - 9) / 24 * 2 * np.pi)
+    return np.clip(70 + daily + rng.normal(0, 6, len(timestamps)), 40, 180)
+
+def make_heart_rate_frame(n_records, days=3, seed=0):
+    """DataFrame with 'timestamp' and 'value' columns, like processed_health_data_sample.csv"""
+    rng = np.random.RandomState(seed)
+    start = pd.Timestamp('2021-11-25')
+    offsets = np.sort(rng.uniform(0, days * 86400, n_records))
+    timestamps = start + pd.to_timedelta(offsets, unit='s')
+    return pd.DataFrame({'timestamp': timestamps,
+                         'value': heart_rate_values(timestamps, rng)})
+
+def write_health_export(file_path, n_records, seed=0):
+    """Apple Health export.xml with N records of mixed types"""
+    rng = np.random.RandomState(seed)
+    start = datetime(2021, 11, 25)
+    type_idx = rng.randint(0, len(RECORD_TYPES), n_records)
+    offsets = np.sort(rng.uniform(0, 30 * 86400, n_records))
+    timestamps = pd.Timestamp(start) + pd.to_timedelta(offsets, unit='s')
+    hr = heart_rate_values(timestamps, rng)
+    other = rng.uniform(0, 100, n_records)
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<HealthData locale="tr_TR">\n')
+        f.write(' <ExportDate value="2024-11-01 12:00:00 +0300"/>\n')
+        for i in range(n_records):
+            record_type, unit = RECORD_TYPES[type_idx[i]]
+            value = hr[i] if type_idx[i] == 0 else other[i]
+            date = timestamps[i].strftime('%Y-%m-%d %H:%M:%S +0300')
+            f.write(f' <Record type="{record_type}" sourceName="Apple Watch" '
+                    f'unit="{unit}" creationDate="{date}" startDate="{date}" '
+                    f'endDate="{date}" value="{value:.0f}"/>\n')
+        f.write('</HealthData>\n')
+
+def make_ecg_signal(seconds, sampling_rate=ECG_SAMPLING_RATE, bpm=70, seed=0):
+    """ECG-like signal (µV) with R-peaks, baseline wander and noise"""
+    rng = np.random.RandomState(seed)
+    n = int(seconds * sampling_rate)
+
+    # RR aralıkları: ortalama nabız + değişkenlik + ara sıra erken atım
+    n_beats = int(seconds * bpm / 60) + 2
+    rr = rng.normal(60 / bpm, 0.05, n_beats)
+    early = rng.rand(n_beats) < 0.03
+    rr[early] *= 0.6
+    peaks = (np.cumsum(rr) * sampling_rate).astype(int)
+    peaks = peaks[peaks < n]
+
+    impulses = np.zeros(n)
+    impulses[peaks] = 1000
+    qrs = np.exp(-0.5 * (np.arange(-25, 26) / 5) ** 2)
+    signal = np.convolve(impulses, qrs, mode='same')
+
+    t = np.arange(n) / sampling_rate
+    signal += 50 * np.sin(2 * np.pi * 0.3 * t) + rng.normal(0, 20, n)
+    return signal
+
+def write_ecg_files(folder_path, n_files, year='2021', seconds=30, seed=0):
+    """Apple Watch ECG CSVs with the 13-line header load_all_ecg_data skips"""
+    os.makedirs(folder_path, exist_ok=True)
+    start = datetime(int(year), 1, 1)
+
+    for i in range(n_files):
+        date = start + timedelta(days=i)
+        signal = make_ecg_signal(seconds, seed=seed + i)
+        t = np.arange(len(signal)) / ECG_SAMPLING_RATE
+        header = [
+            'Name,Synthetic Subject',
+            'Date of Birth,1 Jan 2000',
+            f'Recorded Date,{date:%Y-%m-%d} 10:00:00 +0300',
+            'Classification,Sinus Rhythm',
+            'Symptoms,',
+            'Software Version,2',
+            'Device,Watch6,1',
+            f'Sample Rate,{ECG_SAMPLING_RATE} hertz',
+            '',
+            'Lead,Lead I',
+            'Unit,µV',
+            '',
+            '',
+        ]
+        path = os.path.join(folder_path, f'ecg_{date:%Y-%m-%d}_{i}.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(header) + '\n')
+            f.write('\n'.join(f'{ti:.4f},{v:.3f}' for ti, v in zip(t, signal)) + '\n')
+
+def write_gpx_route(file_path, n_points, seed=0):
+    """GPX running route with one point per second"""
+    rng = np.random.RandomState(seed)
+    # ~3 m/s koşu, rastgele yön değişimi
+    heading = np.cumsum(rng.normal(0, 0.1, n_points))
+    step = np.abs(rng.normal(3.0, 0.4, n_points))
+    lat = 41.0 + np.cumsum(step * np.cos(heading)) / 111320
+    lon = 29.0 + np.cumsum(step * np.sin(heading)) / (111320 * np.cos(np.radians(41.0)))
+    ele = 50 + np.cumsum(rng.normal(0, 0.3, n_points))
+    start = datetime(2022, 7, 30, 7, 0, 0)
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<gpx version="1.1" creator="synthetic" '
+                'xmlns="http://www.topografix.com/GPX/1/1">\n')
+        f.write(' <trk><name>Synthetic Route</name><trkseg>\n')
+        for i in range(n_points):
+            time = start + timedelta(seconds=i)
+            f.write(f'  <trkpt lat="{lat[i]:.7f}" lon="{lon[i]:.7f}">'
+                    f'<ele>{ele[i]:.1f}</ele>'
+                    f'<time>{time:%Y-%m-%dT%H:%M:%SZ}</time></trkpt>\n')
+        f.write(' </trkseg></trk>\n</gpx>\n')
+
+def make_enabiz_lines(n_lines, seed=0):
+    """e-Nabız style text lines (dated, undated and noise lines)"""
+    rng = np.random.RandomState(seed)
+    lines = []
+    for i in range(n_lines):
+        name, unit, mean = BLOOD_TESTS[rng.randint(len(BLOOD_TESTS))]
+        value = abs(rng.normal(mean, mean * 0.2))
+        kind = i % 3
+        if kind == 0:
+            lines.append(f'{rng.randint(1, 13)}/{rng.randint(1, 29)}/2024 '
+                         f'Biyokimya {name} {value:.1f} {unit}')
+        elif kind == 1:
+            lines.append(f'- {name} {value:.1f} {unit}')
+        else:
+            lines.append('Sonuç Referans Aralığı Birim Açıklama')
+    return lines
+
+def write_enabiz_text(file_path, n_lines, seed=0):
+    """Text file with e-Nabız style lines, one per line"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(make_enabiz_lines(n_lines, seed)) + '\n')
@@ -14,7 +14,7 @@ def calculate_pace(distance, time):
     pace = hours / (distance / 1000)  # hours per kilometer
     return pace * 60  # convert to minutes per kilometer
 
-def analyze_gpx_with_pace(file_path):
+def analyze_gpx_with_pace(file_path, plot=True):
     """Analyze a GPX file with detailed pace analysis"""
     try:
         with open(file_path, 'r') as gpx_file:
@@ -69,7 +69,7 @@ def analyze_gpx_with_pace(file_path):
             print(f"Elevation loss: {downhill:.1f} m")
             
             # Plot pace distribution
-            if paces:
+            if paces and plot:
                 plt.figure(figsize=(12, 6))
                 
                 # Pace over distance
@@ -96,8 +96,20 @@ def analyze_gpx_with_pace(file_path):
                 plt.tight_layout()
                 plt.show()
             
+            return {
+                'file': os.path.basename(file_path),
+                'distance_km': moving_data.moving_distance / 1000,
+                'duration_min': moving_data.moving_time / 60,
+                'avg_pace': avg_pace,
+                'best_pace': min_pace,
+                'slowest_pace': max_pace,
+                'elevation_gain': uphill,
+                'elevation_loss': downhill
+            }
+            
     except Exception as e:
         print(f"Error analyzing {file_path}: {str(e)}")
+        return None
 
 def main():
     workout_dir = 'workout-routes'